@@ -1,13 +1,118 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timezone
+from sys import intern
+import asyncio
+import gzip
+import hashlib
 import json
+import os
 import re
+import threading
 
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import (
+    HTMLResponse,
+    JSONResponse,
+    PlainTextResponse,
+    Response,
+    StreamingResponse,
+)
+
+try:
+    import orjson
+except ImportError:  # still runs (slower) where the orjson wheel is missing
+    orjson = None
+
+if orjson is None:
+    try:
+        import ujson  # C extension with no Rust toolchain needed; ~2x stdlib
+    except ImportError:
+        ujson = None
+else:
+    ujson = None
+
+# -------------------------------------------------------------------
+# JSON encode / decode
+# -------------------------------------------------------------------
+
+
+def json_dumps(obj: Any, newline: bool = False) -> bytes:
+    """
+    Compact UTF-8 JSON bytes: orjson when installed, else ujson, else
+    stdlib json. newline=True appends "\n" during encoding rather than by
+    a bytes copy. Values the fast encoders reject (integers beyond 64 bits,
+    which the stdlib file fallback can load) are retried with stdlib json.
+    """
+    text = None
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE if newline else None)
+        except TypeError:  # orjson.JSONEncodeError
+            pass
+    elif ujson is not None:
+        try:
+            text = ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+        except (TypeError, OverflowError):
+            pass
+    if text is None:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return (text + "\n" if newline else text).encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes. Every backend raises a ValueError subclass on bad input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if ujson is not None:
+        return ujson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with json_dumps (orjson: C encoder, emits bytes
+    directly). fastapi.responses.ORJSONResponse is deprecated upstream.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
 
-app = FastAPI(title="PrizePicks/Underdog Props Proxy – Multi-Sport Board")
+
+app = FastAPI(
+    title="PrizePicks/Underdog Props Proxy – Multi-Sport Board",
+    default_response_class=FastJSONResponse,
+)
+
+# Routes that serve a precompressed body and negotiate Accept-Encoding (q=0
+# included) and Vary themselves. GZipMiddleware only substring-matches
+# "gzip" and appends its own Vary, so it must not see these.
+SELF_ENCODED_PATHS = frozenset({"/", "/upload", "/export", "/props.json"})
+
+
+class _GZipExceptSelfEncoded:
+    """
+    GZipMiddleware for every path except SELF_ENCODED_PATHS.
+    """
+
+    def __init__(self, app, **gzip_options: Any) -> None:
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, **gzip_options)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"] in SELF_ENCODED_PATHS:
+            await self.app(scope, receive, send)
+        else:
+            await self.gzip_app(scope, receive, send)
+
+
+# Compresses the dynamic text/JSON responses (model board, exports, jsonl).
+app.add_middleware(_GZipExceptSelfEncoded, minimum_size=1024)
 
 # -------------------------------------------------------------------
 # Files / paths
@@ -46,6 +151,9 @@ UNDERDOG_SPORT_IDS: Dict[str, str] = {
 
 ALLOWED_TIERS = {"standard", "goblin", "demon"}
 
+# Largest /update-props body we will parse (PrizePicks dumps run a few MB).
+MAX_UPLOAD_BYTES = 20_000_000
+
 # -------------------------------------------------------------------
 # Helpers: sport slugs / keys
 # -------------------------------------------------------------------
@@ -88,35 +196,137 @@ def get_prop_sport_slug(p: Dict[str, Any]) -> str:
 # -------------------------------------------------------------------
 
 
-def save_props(props: List[Dict[str, Any]]) -> None:
+# Keeps concurrent uploads from queueing worker threads on the file lock.
+_props_write_lock = asyncio.Lock()
+
+# Serializes every read/modify/write of props.json within this process:
+# uploads (replace_sport_props) and expiry pruning (get_current_props), which
+# runs in threadpool GET handlers.
+_props_file_lock = threading.Lock()
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """
+    Write to a sibling temp file, fsync it, then rename it over path, so
+    readers never see a half-written file and a crash can't leave a renamed
+    but empty one. The temp name is unique per process and thread, since
+    workers and pruning GETs can save concurrently.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def save_props(props: List[Dict[str, Any]]) -> bytes:
     """
     Save props to props.json and keep a backup copy.
+    Stored compact (no indentation): roughly half the bytes to write and parse.
+    Returns the encoded bytes so callers can reuse them as a response body.
     """
-    text = json.dumps(props, indent=2, ensure_ascii=False)
-    DATA_FILE.write_text(text, encoding="utf-8")
-    BACKUP_FILE.write_text(text, encoding="utf-8")
+    global _file_props_cache
+    data = json_dumps(props, newline=True)
+    _write_bytes_atomic(DATA_FILE, data)
+    # We already hold the parsed form of what was just written, so prime the
+    # read cache instead of letting the next reader re-parse the file.
+    key = data_file_key()
+    if key is not None:
+        _file_props_cache = (key, list(props), _next_expiry(props))
+    _write_bytes_atomic(BACKUP_FILE, data)
+    return data
+
+
+# Last parse of DATA_FILE, keyed by data_file_key() at read time, with the
+# earliest game_time in it (so expiry checks don't re-parse every string).
+_file_props_cache: Optional[
+    Tuple[Tuple[int, int, int], List[Dict[str, Any]], Optional[datetime]]
+] = None
+
+
+def data_file_key() -> Optional[Tuple[int, int, int]]:
+    """
+    (inode, mtime_ns, size) of props.json, or None if it doesn't exist.
+    Changes whenever the file is rewritten (save_props replaces the inode).
+    """
+    try:
+        st = DATA_FILE.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _loads_props_file(path: Path) -> Any:
+    """
+    Parse a props file with the fast decoder, retrying with stdlib json for
+    hand-edited files it rejects (NaN/Infinity literals, huge integers).
+    """
+    data = path.read_bytes()
+    try:
+        return json_loads(data)
+    except ValueError:
+        return json.loads(data)
 
 
 def load_file_props_raw_or_empty() -> List[Dict[str, Any]]:
     """
     Load props from disk without adding dummy values.
     Prefer main file, then backup. Return [] if nothing valid.
+    The main file is only re-parsed when its stat key changes; the returned
+    list is shared with that cache, so callers must not mutate it.
+    """
+    return _load_file_props()[0]
+
+
+def _load_file_props() -> Tuple[List[Dict[str, Any]], Optional[datetime]]:
+    """
+    load_file_props_raw_or_empty() plus the earliest game_time in the list.
     """
-    if DATA_FILE.exists():
+    global _file_props_cache
+    key = data_file_key()
+    if key is not None:
+        cached = _file_props_cache
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
         try:
-            with DATA_FILE.open("r", encoding="utf-8") as f:
-                return json.load(f)
+            props = _loads_props_file(DATA_FILE)
+            expires = _next_expiry(props)
+            _file_props_cache = (key, props, expires)
+            return props, expires
         except Exception:
             pass
 
     if BACKUP_FILE.exists():
         try:
-            with BACKUP_FILE.open("r", encoding="utf-8") as f:
-                return json.load(f)
+            props = _loads_props_file(BACKUP_FILE)
+            return props, _next_expiry(props)
         except Exception:
             pass
 
-    return []
+    return [], None
+
+
+@lru_cache(maxsize=4096)
+def _parse_game_time_cached(s: str) -> Optional[datetime]:
+    """
+    Parse one game_time string. Cached because the same kickoff times repeat
+    across every prop in a game; the returned datetimes are immutable.
+    """
+    s = s.strip()
+    if s.endswith("Z"):
+        s = s[:-1] + "+00:00"
+    try:
+        dt = datetime.fromisoformat(s)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
 
 
 def _parse_game_time(value: Any) -> Optional[datetime]:
@@ -127,13 +337,7 @@ def _parse_game_time(value: Any) -> Optional[datetime]:
     if not value:
         return None
     try:
-        s = str(value).strip()
-        if s.endswith("Z"):
-            s = s[:-1] + "+00:00"
-        dt = datetime.fromisoformat(s)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc)
+        return _parse_game_time_cached(value if type(value) is str else str(value))
     except Exception:
         return None
 
@@ -144,15 +348,34 @@ def get_current_props() -> List[Dict[str, Any]]:
     Writes the cleaned list back to disk when it changes.
     No dummy fallback: returns [] if nothing is stored.
     """
-    raw = load_file_props_raw_or_empty()
+    raw, expires = _load_file_props()
     if not raw:
         return []
 
+    # Nothing can have expired before the earliest game_time, so the common
+    # case is a copy with no per-prop date parsing.
+    if expires is None or expires >= datetime.now(timezone.utc):
+        return list(raw)
+
+    with _props_file_lock:
+        # Re-read under the lock: an upload may have replaced the file since
+        # the read above, and pruning the older list would overwrite it.
+        raw, _ = _load_file_props()
+        filtered = _drop_expired(raw)
+        if len(filtered) != len(raw):
+            save_props(filtered)
+
+    return filtered
+
+
+def _drop_expired(props: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    props minus any whose game_time is already in the past.
+    """
     now = datetime.now(timezone.utc)
     filtered: List[Dict[str, Any]] = []
-    changed = False
 
-    for p in raw:
+    for p in props:
         gt = _parse_game_time(p.get("game_time"))
         if gt is None:
             # If no time or can't parse, keep it rather than silently delete.
@@ -160,29 +383,287 @@ def get_current_props() -> List[Dict[str, Any]]:
             continue
         if gt >= now:
             filtered.append(p)
+
+    return filtered
+
+
+def replace_sport_props(
+    new_props: List[Dict[str, Any]],
+    sport_slug: Optional[str],
+    out_label: Optional[str],
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Swap the stored props for one sport slice with new_props and save.
+    Expired props are dropped before saving, so what is written is exactly
+    the live board. Returns that board and a /props.json cache entry built
+    from the bytes just written, so callers on a worker thread also get the
+    gzip/ETag work off the event loop.
+    """
+    with _props_file_lock:
+        existing = load_file_props_raw_or_empty()
+
+        # Remove any old props for this sport_slug, then append new ones. The
+        # comprehension builds a fresh list (existing is the shared read cache),
+        # so extending it in place avoids a remaining + new_props copy.
+        if sport_slug:
+            combined = [p for p in existing if get_prop_sport_slug(p) != sport_slug]
         else:
-            changed = True
+            label_lower = (out_label or "").lower()
+            combined = [p for p in existing if (p.get("sport") or "").lower() != label_lower]
+        combined.extend(new_props)
 
-    if changed:
-        save_props(filtered)
+        live = _drop_expired(combined)
+        body = save_props(live)
+        key = data_file_key()
 
-    return filtered
+    return live, build_props_body_cache(live, key, body)
+
+# -------------------------------------------------------------------
+# Helpers: cached /props.json body
+# -------------------------------------------------------------------
+
+# Short freshness window: the board only changes on upload, and clients
+# revalidate with If-None-Match (usually a bodyless 304) after it lapses.
+# The board page's own fetch uses cache: "no-cache" so Reload always revalidates.
+PROPS_JSON_CACHE_CONTROL = "public, max-age=5, stale-while-revalidate=60"
+
+# Serialized live board, rebuilt on upload or once its earliest game starts.
+_props_body_cache: Optional[Dict[str, Any]] = None
+
+
+def _next_expiry(props: List[Dict[str, Any]]) -> Optional[datetime]:
+    """
+    Earliest parseable game_time in props, i.e. when the live set next shrinks.
+    """
+    earliest: Optional[datetime] = None
+    for p in props:
+        gt = _parse_game_time(p.get("game_time"))
+        if gt is not None and (earliest is None or gt < earliest):
+            earliest = gt
+    return earliest
+
+
+def build_props_body_cache(
+    props: List[Dict[str, Any]],
+    file_key: Optional[Tuple[int, int, int]],
+    body: Optional[bytes] = None,
+) -> Dict[str, Any]:
+    """
+    Serialize the live props once into a /props.json cache entry (body, ETag,
+    gzip copy, next expiry). Does not install it; see set_props_body_cache.
+    file_key is data_file_key() for the file state props were read from.
+    body may be passed in when the caller already encoded props (e.g. the
+    bytes save_props just wrote), to skip a second serialization. Built the
+    same way as save_props (trailing newline) so a rebuild of the same board
+    keeps the same ETag.
+    """
+    if body is None:
+        body = json_dumps(props, newline=True)
+    return {
+        "body": body,
+        # Weak: the identity and gzip bodies are the same representation.
+        "etag": 'W/"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"',
+        # Compressed once here instead of per response.
+        "gzip": gzip.compress(body, 6),
+        "expires": _next_expiry(props),
+        "file_key": file_key,
+    }
+
+
+def set_props_body_cache(
+    props: List[Dict[str, Any]],
+    file_key: Optional[Tuple[int, int, int]],
+    body: Optional[bytes] = None,
+) -> Dict[str, Any]:
+    """
+    Build a /props.json cache entry and keep it in memory.
+    """
+    global _props_body_cache
+    _props_body_cache = build_props_body_cache(props, file_key, body)
+    return _props_body_cache
+
+
+def get_props_body_cache() -> Dict[str, Any]:
+    """
+    Return the cached /props.json body, rebuilding it when props.json changed
+    on disk (e.g. an upload handled by another worker) or a prop has expired.
+    """
+    cache = _props_body_cache
+    if cache is None or cache["file_key"] != data_file_key():
+        return _rebuild_props_body_cache()
+    expires = cache["expires"]
+    if expires is not None and expires < datetime.now(timezone.utc):
+        return _rebuild_props_body_cache()
+    return cache
+
+
+def _rebuild_props_body_cache() -> Dict[str, Any]:
+    """
+    Rebuild from the live props. The file key is read afterwards because
+    get_current_props() may prune and rewrite props.json; an entry stored
+    under the pre-prune key would be rebuilt again on the next request.
+    """
+    props = get_current_props()
+    return set_props_body_cache(props, data_file_key())
+
+
+def _accepts_gzip(request: Request) -> bool:
+    """
+    True if Accept-Encoding lists gzip without q=0.
+    """
+    for part in request.headers.get("accept-encoding", "").split(","):
+        coding, *params = part.split(";")
+        if coding.strip().lower() != "gzip":
+            continue
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """
+    True if the request's If-None-Match header covers etag
+    (weak comparison, as If-None-Match requires).
+    """
+    inm = request.headers.get("if-none-match")
+    if not inm:
+        return False
+    if inm.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for tag in inm.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == opaque:
+            return True
+    return False
+
+# -------------------------------------------------------------------
+# Helpers: static HTML pages
+# -------------------------------------------------------------------
+
+STATIC_PAGE_CACHE_CONTROL = "public, max-age=300"
+
+
+def build_static_page(html: str) -> Dict[str, Any]:
+    """
+    Encode a constant HTML page once at import time, fingerprint it, and
+    keep a gzip copy so compressing it is never per-request work.
+    """
+    body = html.encode("utf-8")
+    return {
+        "body": body,
+        # Weak: the identity and gzip bodies are the same representation.
+        "etag": 'W/"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"',
+        "gzip": gzip.compress(body, 9),
+    }
+
+
+def static_page_response(request: Request, page: Dict[str, Any]) -> Response:
+    """
+    Serve a prebuilt page (gzipped when accepted), or a bodyless 304 when
+    the client's copy is current.
+    """
+    headers = {
+        "ETag": page["etag"],
+        "Cache-Control": STATIC_PAGE_CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+    }
+    if _etag_matches(request, page["etag"]):
+        return Response(status_code=304, headers=headers)
+    if _accepts_gzip(request):
+        headers["Content-Encoding"] = "gzip"
+        return Response(page["gzip"], media_type="text/html; charset=utf-8", headers=headers)
+    return Response(page["body"], media_type="text/html; charset=utf-8", headers=headers)
 
 # -------------------------------------------------------------------
 # Normalization helpers
 # -------------------------------------------------------------------
 
 
+def _intern(value: Any) -> Any:
+    """
+    sys.intern() for strings so repeated values (teams, leagues, stats) share
+    one object across rows; non-strings are returned unchanged.
+    """
+    return intern(value) if type(value) is str else value
+
+
+def _first(d: Dict[str, Any], *keys: str, default: Any = "") -> Any:
+    """
+    First truthy d[key] among keys, else default. One call replaces a chain
+    of d.get(a) or d.get(b) or ... fallbacks.
+    """
+    get = d.get
+    for key in keys:
+        value = get(key)
+        if value:
+            return value
+    return default
+
+
+# PrizePicks "included" item type -> helper map it feeds.
+_INCLUDED_KINDS: Dict[str, str] = {
+    "new_player": "player",
+    "player": "player",
+    "team": "team",
+    "game": "game",
+}
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """
+    float(value), or None when the value is missing or not numeric.
+    """
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# The stat vocabulary is a few dozen values that repeat across every upload,
+# so slugs are computed once per process and interned. Bounded so a stream of
+# junk stat names can't grow it without limit.
+@lru_cache(maxsize=256)
+def _market_slug(stat: str) -> str:
+    """
+    "Pass Yards" -> "pass_yards".
+    """
+    return intern(stat.lower().replace(" ", "_"))
+
+
+# Shared read-only default for missing sub-objects, so absent keys don't
+# allocate a fresh {} per row. Never mutate it.
+_EMPTY: Dict[str, Any] = {}
+
+
+def _opponent_of(team: Any, home: Optional[str], away: Optional[str]) -> str:
+    """
+    The other side of a home/away pair for team, or "" if team is in neither.
+    """
+    if not (team and home and away):
+        return ""
+    if team == home:
+        return away
+    if team == away:
+        return home
+    return ""
+
+
 def _extract_tier_from_attrs(attrs: Dict[str, Any]) -> str:
     """
     Map attributes['odds_Type'] (or variations) into "goblin" / "standard" / "demon".
     """
-    raw = (
-        attrs.get("odds_Type")
-        or attrs.get("odds_type")
-        or attrs.get("oddsType")
-        or attrs.get("tier")
-    )
+    raw = _first(attrs, "odds_Type", "odds_type", "oddsType", "tier", default=None)
     if not raw:
         return "standard"
 
@@ -198,6 +679,23 @@ def _extract_tier_from_attrs(attrs: Dict[str, Any]) -> str:
     return "standard"
 
 
+def _prizepicks_league_ids(data: Sequence[Dict[str, Any]]) -> set:
+    """
+    Every league id (relationship or attribute) referenced by the projections.
+    """
+    league_ids = set()
+    for proj in data:
+        attrs = proj.get("attributes") or _EMPTY
+        rel_league = ((proj.get("relationships") or _EMPTY).get("league") or _EMPTY).get("data") or _EMPTY
+        lid_rel = rel_league.get("id")
+        if lid_rel is not None:
+            league_ids.add(str(lid_rel))
+        lid_attr = attrs.get("league_id")
+        if lid_attr is not None:
+            league_ids.add(str(lid_attr))
+    return league_ids
+
+
 def normalize_prizepicks(
     raw: Dict[str, Any],
     sport_key: str,
@@ -216,167 +714,163 @@ def normalize_prizepicks(
         expected_league_id = None
         sport_slug = sport_slug_from_label(sport_name)
     else:
-        if sport_key not in SPORTS:
+        sport_cfg = SPORTS.get(sport_key)
+        if sport_cfg is None:
             raise ValueError(f"Unknown sport key: {sport_key}")
-        sport_cfg = SPORTS[sport_key]
         sport_name = sport_cfg["name"]
         expected_league_id = sport_cfg["league_id"]
         sport_slug = sport_key
 
-    data = raw.get("data", []) or []
-    included = raw.get("included", []) or []
-
-    # Validate league_id when possible
-    league_ids = set()
-    for proj in data:
-        attrs = proj.get("attributes", {}) or {}
-        rel_league = (proj.get("relationships", {}).get("league") or {}).get("data") or {}
-        lid_rel = rel_league.get("id")
-        if lid_rel is not None:
-            league_ids.add(str(lid_rel))
-        lid_attr = attrs.get("league_id")
-        if lid_attr is not None:
-            league_ids.add(str(lid_attr))
-
-    if expected_league_id and league_ids and league_ids != {expected_league_id}:
-        raise ValueError(
-            f"League mismatch: selected {sport_name} (league_id {expected_league_id}), "
-            f"but JSON contained league ids {sorted(league_ids)}"
-        )
-
-    # Build helper maps from "included"
-    players: Dict[str, Dict[str, Any]] = {}
-    games: Dict[str, Dict[str, Any]] = {}
-    teams: Dict[str, Dict[str, Any]] = {}
+    data = raw.get("data") or ()
+    included = raw.get("included") or ()
+
+    # Validate league_id when possible. The happy path is one compare per id
+    # and no allocation; the full id set is only gathered to word the error.
+    if expected_league_id:
+        for proj in data:
+            attrs = proj.get("attributes") or _EMPTY
+            rel_league = ((proj.get("relationships") or _EMPTY).get("league") or _EMPTY).get("data") or _EMPTY
+            lid_rel = rel_league.get("id")
+            lid_attr = attrs.get("league_id")
+            if (lid_rel is not None and str(lid_rel) != expected_league_id) or (
+                lid_attr is not None and str(lid_attr) != expected_league_id
+            ):
+                raise ValueError(
+                    f"League mismatch: selected {sport_name} (league_id {expected_league_id}), "
+                    f"but JSON contained league ids {sorted(_prizepicks_league_ids(data))}"
+                )
 
+    # Bucket "included" by kind in one pass, then build each helper map
+    # with a comprehension over its own bucket (no per-item type branching).
+    # Unrecognised types are dropped here rather than bucketed.
+    by_kind: Dict[str, List[Dict[str, Any]]] = {"player": [], "team": [], "game": []}
     for item in included:
         itype = item.get("type")
-        attrs = item.get("attributes", {}) or {}
-        iid = item.get("id")
-        if not iid:
+        # Only str types are looked up: a list/object "type" is skipped, not
+        # a TypeError (unhashable) that fails the upload.
+        kind = _INCLUDED_KINDS.get(itype) if type(itype) is str else None
+        if kind and item.get("id"):
+            by_kind[kind].append(item)
+
+    # Flat tuple-valued maps: the row loop does one lookup per player/game and
+    # unpacks, instead of a dict fetch followed by several .get() calls.
+    # Team abbreviations are resolved into each game tuple up front, and the
+    # "Unknown"/sport_name defaults are applied here rather than per row.
+    players: Dict[str, Tuple[Any, str, str]] = {
+        item["id"]: (
+            attrs.get("name") or "Unknown",
+            _intern(_first(attrs, "team", "team_abbreviation")),
+            _intern(attrs.get("league") or sport_name),
+        )
+        for item in by_kind["player"]
+        for attrs in (item.get("attributes"),)
+        if attrs
+    }
+    teams: Dict[str, str] = {
+        item["id"]: _intern(attrs.get("abbreviation") or "")
+        for item in by_kind["team"]
+        for attrs in (item.get("attributes"),)
+        if attrs
+    }
+    # A game whose team reference is malformed (e.g. an unhashable id) maps
+    # to None, and build_row skips rows on it rather than failing the upload.
+    games: Dict[str, Optional[Tuple[Optional[str], Optional[str], Any]]] = {}
+    teams_get = teams.get
+    for item in by_kind["game"]:
+        attrs = item.get("attributes") or _EMPTY
+        rel = item.get("relationships") or _EMPTY
+        try:
+            home = teams_get(((rel.get("home_team_data") or _EMPTY).get("data") or _EMPTY).get("id"))
+            away = teams_get(((rel.get("away_team_data") or _EMPTY).get("data") or _EMPTY).get("id"))
+        except (TypeError, AttributeError):
+            games[item["id"]] = None
             continue
-
-        if itype in ("new_player", "player"):
-            players[iid] = {
-                "name": attrs.get("name"),
-                "team": attrs.get("team")
-                or attrs.get("team_abbreviation")
-                or "",
-                "league": attrs.get("league") or sport_name,
-            }
-        elif itype == "team":
-            teams[iid] = {
-                "abbreviation": attrs.get("abbreviation") or "",
-                "name": attrs.get("name") or "",
-                "market": attrs.get("market") or "",
-            }
-        elif itype == "game":
-            rel = item.get("relationships", {}) or {}
-            home_rel = (rel.get("home_team_data") or {}).get("data") or {}
-            away_rel = (rel.get("away_team_data") or {}).get("data") or {}
-            games[iid] = {
-                "home_team_id": home_rel.get("id"),
-                "away_team_id": away_rel.get("id"),
-                "start_time": attrs.get("start_time") or attrs.get("start_at"),
-            }
-
-    props: List[Dict[str, Any]] = []
-
-    for proj in data:
+        games[item["id"]] = (home, away, _intern(_first(attrs, "start_time", "start_at", default=None)))
+    no_player = ("Unknown", "", sport_name)
+    no_game = (None, None, None)
+
+    # Bind hot lookups once.
+    players_get = players.get
+    games_get = games.get
+    # (game_id, team) -> opponent; a slate has far fewer pairs than projections.
+    opponents: Dict[Tuple[Any, str], str] = {}
+    opponents_get = opponents.get
+
+    def build_row(proj: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        One projection -> one prop dict, or None for a row we can't use.
+
+        A malformed row (non-dict relationships, unhashable ids, ...) is
+        skipped rather than failing the whole upload.
+        """
         try:
-            pid = proj.get("id")
-            attrs = proj.get("attributes", {}) or {}
-            rel = proj.get("relationships", {}) or {}
+            pget = proj.get
+            pid = pget("id")
             if not pid:
-                continue
+                return None
+            attrs = pget("attributes")
+            if not attrs:
+                return None
+            aget = attrs.get
+            rel = pget("relationships") or _EMPTY
 
-            player_rel = (rel.get("new_player") or rel.get("player") or {}).get("data") or {}
-            game_rel = (rel.get("game") or {}).get("data") or {}
+            stat = _intern(_first(attrs, "stat_type", "stat", "stat_display_name"))
+            if not stat:
+                return None
 
-            player_id = player_rel.get("id")
-            game_id = game_rel.get("id")
+            line_val = _to_float(aget("line_score"))
+            if line_val is None:
+                return None
 
-            player_info = players.get(player_id, {})
-            game_info = games.get(game_id, {})
-
-            player = player_info.get("name") or "Unknown"
-            team = player_info.get("team") or ""
-            league = player_info.get("league") or sport_name
-
-            home_team_abbr = None
-            away_team_abbr = None
-            if game_info:
-                home_team_id = game_info.get("home_team_id")
-                away_team_id = game_info.get("away_team_id")
-                if home_team_id and home_team_id in teams:
-                    home_team_abbr = teams[home_team_id]["abbreviation"]
-                if away_team_id and away_team_id in teams:
-                    away_team_abbr = teams[away_team_id]["abbreviation"]
-
-            opponent = ""
-            if team and home_team_abbr and away_team_abbr:
-                if team == home_team_abbr:
-                    opponent = away_team_abbr
-                elif team == away_team_abbr:
-                    opponent = home_team_abbr
+            rget = rel.get
+            player_rel = (rget("new_player") or rget("player") or _EMPTY).get("data") or _EMPTY
+            game_rel = (rget("game") or _EMPTY).get("data") or _EMPTY
 
+            game_id = game_rel.get("id")
+            player, team, league = players_get(player_rel.get("id")) or no_player
+            game = games_get(game_id, no_game)
+            if game is None:
+                return None
+            home_team_abbr, away_team_abbr, game_start = game
+
+            opp_key = (game_id, team)
+            opponent = opponents_get(opp_key)
+            if opponent is None:
+                opponent = opponents[opp_key] = _opponent_of(team, home_team_abbr, away_team_abbr)
             if not opponent and home_team_abbr and away_team_abbr:
-                desc_team = attrs.get("description")
-                if desc_team == home_team_abbr:
-                    opponent = away_team_abbr
-                elif desc_team == away_team_abbr:
-                    opponent = home_team_abbr
-
-            stat = (
-                attrs.get("stat_type")
-                or attrs.get("stat")
-                or attrs.get("stat_display_name")
-                or ""
-            )
-            line_val = attrs.get("line_score")
-            if line_val is not None:
-                try:
-                    line_val = float(line_val)
-                except Exception:
-                    line_val = None
-
-            start_time = (
-                game_info.get("start_time")
-                or attrs.get("start_time")
-                or attrs.get("start_at")
-            )
+                opponent = _opponent_of(aget("description"), home_team_abbr, away_team_abbr)
 
-            tier = _extract_tier_from_attrs(attrs)
+            start_time = game_start or _first(attrs, "start_time", "start_at", default=None)
 
-            if not player or line_val is None or not stat:
-                continue
+            tier = _extract_tier_from_attrs(attrs)
 
-            props.append(
-                {
-                    "id": pid,
-                    "source": "prizepicks",
-                    "board": sport_name,
-                    "league": league,
-                    "sport": sport_name,
-                    "sport_slug": sport_slug,
-                    "player": player,
-                    "team": team,
-                    "opponent": opponent,
-                    "stat": stat,
-                    "market": str(stat).lower().replace(" ", "_"),
-                    "line": line_val,
-                    "game_time": start_time,
-                    "projection_type": "main",
-                    "tier": tier,
-                    "ud_american_over": None,
-                    "ud_american_under": None,
-                }
-            )
-        except Exception:
-            # Skip malformed entries rather than killing the whole upload
-            continue
+            market = _market_slug(stat if type(stat) is str else str(stat))
+
+            return {
+                "id": pid,
+                "source": "prizepicks",
+                "board": sport_name,
+                "league": league,
+                "sport": sport_name,
+                "sport_slug": sport_slug,
+                "player": player,
+                "team": team,
+                "opponent": opponent,
+                "stat": stat,
+                "market": market,
+                "line": line_val,
+                "game_time": start_time,
+                "projection_type": "main",
+                "tier": tier,
+                "ud_american_over": None,
+                "ud_american_under": None,
+            }
+        except (TypeError, AttributeError, ValueError):
+            return None
 
-    return props
+    # build_row returns a non-empty dict or None, so filter(None, ...) keeps
+    # exactly the usable rows without a Python-level test per row.
+    return list(filter(None, map(build_row, data)))
 
 
 def normalize_underdog(
@@ -401,15 +895,16 @@ def normalize_underdog(
         expected_sport_id = None
         sport_slug = sport_slug_from_label(sport_name)
     else:
-        if sport_key not in SPORTS:
+        sport_cfg = SPORTS.get(sport_key)
+        if sport_cfg is None:
             raise ValueError(f"Unknown sport key: {sport_key}")
-        sport_name = SPORTS[sport_key]["name"]
+        sport_name = sport_cfg["name"]
         expected_sport_id = UNDERDOG_SPORT_IDS.get(sport_key)
         sport_slug = sport_key
 
-    games = {g.get("id"): g for g in (raw.get("games") or []) if g.get("id") is not None}
+    games = {g.get("id"): g for g in (raw.get("games") or ()) if g.get("id") is not None}
     appearances = {
-        a.get("id"): a for a in (raw.get("appearances") or []) if a.get("id") is not None
+        a.get("id"): a for a in (raw.get("appearances") or ()) if a.get("id") is not None
     }
 
     # Validate sport_id when possible
@@ -426,42 +921,42 @@ def normalize_underdog(
             )
 
     props: List[Dict[str, Any]] = []
-    lines = raw.get("over_under_lines") or []
+    lines = raw.get("over_under_lines") or ()
+
+    # Bind hot lookups once.
+    appearances_get = appearances.get
+    games_get = games.get
+    append = props.append
 
+    # Skip malformed lines rather than failing the whole upload: a non-string
+    # status/title/choice or a non-dict nested object raises here. The
+    # handler is only for those type errors; try is free on the happy path.
     for line in lines:
         try:
             status = (line.get("status") or "").lower()
             if status and status != "active":
                 continue
 
-            over_under = line.get("over_under") or {}
-            app_stat = over_under.get("appearance_stat") or {}
+            over_under = line.get("over_under") or _EMPTY
+            app_stat = over_under.get("appearance_stat") or _EMPTY
 
-            stat_display = app_stat.get("display_stat") or ""
-            stat_code = app_stat.get("stat") or ""
+            stat_display = _intern(app_stat.get("display_stat") or "")
+            stat_code = _intern(app_stat.get("stat") or "")
             if not stat_display and not stat_code:
                 continue
 
-            stat_value = line.get("stat_value")
-            try:
-                line_val = float(stat_value)
-            except Exception:
+            line_val = _to_float(line.get("stat_value"))
+            if line_val is None:
                 continue
 
             appearance_id = app_stat.get("appearance_id")
-            appearance = appearances.get(appearance_id, {})
-            match_id = appearance.get("match_id")
-            game = games.get(match_id, {})
-
-            game_time = game.get("scheduled_at") or game.get("starts_at")
-            matchup = (
-                game.get("short_title")
-                or game.get("abbreviated_title")
-                or game.get("title")
-                or ""
-            )
+            appearance = appearances_get(appearance_id) or _EMPTY
+            game = games_get(appearance.get("match_id")) or _EMPTY
 
-            options = line.get("options") or []
+            game_time = _first(game, "scheduled_at", "starts_at", default=None)
+            matchup = _first(game, "short_title", "abbreviated_title", "title")
+
+            options = line.get("options") or ()
             player_name = ""
             over_price: Optional[str] = None
             under_price: Optional[str] = None
@@ -486,9 +981,9 @@ def normalize_underdog(
             if not player_name:
                 continue
 
-            market = stat_code or stat_display.replace(" ", "_").lower() or "unknown"
+            market = stat_code or _market_slug(stat_display) or "unknown"
 
-            props.append(
+            append(
                 {
                     "id": line.get("id"),
                     "source": "underdog",
@@ -509,11 +1004,46 @@ def normalize_underdog(
                     "ud_american_under": under_price,
                 }
             )
-        except Exception:
+        except (TypeError, AttributeError, ValueError):
             continue
 
     return props
 
+
+# Recent normalize results keyed by a digest of the upload body, so a
+# re-upload of the same JSON (double tap, retry) skips normalization.
+NORMALIZE_CACHE_SIZE = 8
+_normalize_cache: "OrderedDict[bytes, List[Dict[str, Any]]]" = OrderedDict()
+
+
+def normalize_upload_cached(
+    body: bytes,
+    src_type: str,
+    raw: Dict[str, Any],
+    sport_key: str,
+    sport_label: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run the normalizer for src_type, memoized on the raw request body
+    (which also carries sport / sport_label). The returned list is shared
+    with the cache and must not be mutated.
+    """
+    key = hashlib.blake2b(body, digest_size=16).digest()
+    hit = _normalize_cache.get(key)
+    if hit is not None:
+        _normalize_cache.move_to_end(key)
+        return hit
+
+    if src_type == "prizepicks":
+        props = normalize_prizepicks(raw, sport_key, sport_label=sport_label)
+    else:
+        props = normalize_underdog(raw, sport_key, sport_label=sport_label)
+
+    _normalize_cache[key] = props
+    if len(_normalize_cache) > NORMALIZE_CACHE_SIZE:
+        _normalize_cache.popitem(last=False)
+    return props
+
 # -------------------------------------------------------------------
 # CSV helpers
 # -------------------------------------------------------------------
@@ -521,7 +1051,8 @@ def normalize_underdog(
 
 def _clean_csv_val(v: Any) -> str:
     """Make sure CSV values don't break the row."""
-    return str(v).replace(",", " ").replace("\n", " ").strip()
+    s = v if type(v) is str else str(v)
+    return s.replace(",", " ").replace("\n", " ").strip()
 
 
 def _model_csv_val(v: Any) -> str:
@@ -530,9 +1061,9 @@ def _model_csv_val(v: Any) -> str:
     - remove commas/newlines
     - collapse spaces into underscores so each row has no whitespace
     """
-    s = str(v).replace(",", " ").replace("\n", " ").strip()
-    parts = s.split()
-    return "_".join(parts)
+    s = v if type(v) is str else str(v)
+    # split() already drops newlines and outer whitespace; only commas remain.
+    return "_".join(s.replace(",", " ").split())
 
 # -------------------------------------------------------------------
 # Health
@@ -540,7 +1071,7 @@ def _model_csv_val(v: Any) -> str:
 
 
 @app.get("/health")
-def health():
+async def health():
     return {"status": "ok"}
 
 # -------------------------------------------------------------------
@@ -548,12 +1079,7 @@ def health():
 # -------------------------------------------------------------------
 
 
-@app.get("/", response_class=HTMLResponse)
-def board_view():
-    """
-    Main odds board UI. Data is fetched from /props.json (which uses get_current_props()).
-    """
-    return """
+_BOARD_HTML = """
     <html>
       <head>
         <title>Props Board Viewer</title>
@@ -738,15 +1264,20 @@ def board_view():
             return p.sport || p.league || "";
           }
 
+          const timeLabels = new Map();
+
           function formatTime(isoString) {
             if (!isoString) return "";
+            let label = timeLabels.get(isoString);
+            if (label !== undefined) return label;
             try {
               const d = new Date(isoString);
-              if (isNaN(d.getTime())) return isoString;
-              return d.toLocaleString();
+              label = isNaN(d.getTime()) ? isoString : d.toLocaleString();
             } catch (e) {
-              return isoString;
+              label = isoString;
             }
+            timeLabels.set(isoString, label);
+            return label;
           }
 
           function getTierRaw(p) {
@@ -798,7 +1329,8 @@ def board_view():
 
           function renderTable(props) {
             const tbody = document.getElementById("props-body");
-            tbody.innerHTML = "";
+            // Build all rows off-DOM, then swap them in with a single reflow.
+            const frag = document.createDocumentFragment();
 
             if (!props.length) {
               const tr = document.createElement("tr");
@@ -806,7 +1338,8 @@ def board_view():
               td.colSpan = 9;
               td.textContent = "No props match the current filters or nothing has been uploaded yet.";
               tr.appendChild(td);
-              tbody.appendChild(tr);
+              frag.appendChild(tr);
+              tbody.replaceChildren(frag);
               return;
             }
 
@@ -878,24 +1411,19 @@ def board_view():
               tdSport.appendChild(pillLeague);
               tr.appendChild(tdSport);
 
-              tbody.appendChild(tr);
+              frag.appendChild(tr);
             }
+            tbody.replaceChildren(frag);
           }
 
           function applyFilters() {
             const searchVal = document.getElementById("search").value.toLowerCase().trim();
             const statVal = document.getElementById("stat-filter").value;
             const sportVal = document.getElementById("sport-filter").value;
-            let filtered = allProps.slice();
+            let filtered = allProps;
 
             if (searchVal) {
-              filtered = filtered.filter(p => {
-                return (
-                  (p.player || "").toLowerCase().includes(searchVal) ||
-                  (p.team || "").toLowerCase().includes(searchVal) ||
-                  (p.opponent || "").toLowerCase().includes(searchVal)
-                );
-              });
+              filtered = filtered.filter(p => p._search.includes(searchVal));
             }
 
             if (statVal) {
@@ -913,13 +1441,17 @@ def board_view():
             const status = document.getElementById("status");
             status.textContent = "Refreshing…";
             try {
-              const res = await fetch("/props.json");
+              const res = await fetch("/props.json", { cache: "no-cache" });
               const data = await res.json();
               if (!Array.isArray(data)) {
                 status.textContent = "Unexpected data format from /props.json";
                 return;
               }
               allProps = data;
+              // Lowercase the searchable text once per load, not per keystroke.
+              for (const p of allProps) {
+                p._search = ((p.player || "") + "\t" + (p.team || "") + "\t" + (p.opponent || "")).toLowerCase();
+              }
               renderStatFilter(allProps);
               renderSportFilter(allProps);
               applyFilters();
@@ -929,8 +1461,15 @@ def board_view():
             }
           }
 
+          let searchTimer = null;
+
+          function onSearchInput() {
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(applyFilters, 80);
+          }
+
           document.addEventListener("DOMContentLoaded", () => {
-            document.getElementById("search").addEventListener("input", applyFilters);
+            document.getElementById("search").addEventListener("input", onSearchInput);
             document.getElementById("stat-filter").addEventListener("change", applyFilters);
             document.getElementById("sport-filter").addEventListener("change", applyFilters);
             reloadProps();
@@ -940,24 +1479,75 @@ def board_view():
     </html>
     """
 
+_BOARD_PAGE = build_static_page(_BOARD_HTML)
+
+
+@app.get("/", response_class=HTMLResponse)
+async def board_view(request: Request):
+    """
+    Main odds board UI. Data is fetched from /props.json (which uses get_current_props()).
+    """
+    return static_page_response(request, _BOARD_PAGE)
+
 # -------------------------------------------------------------------
 # Raw props JSON (for UI & scripts)
 # -------------------------------------------------------------------
 
 
 @app.get("/props.json")
-def props_json():
+def props_json(request: Request):
     """
     Raw JSON for the live board, with expired props removed.
+    Served from the in-memory body cache (pre-gzipped when the client
+    accepts it); honours If-None-Match.
+    """
+    cache = get_props_body_cache()
+    headers = {
+        "ETag": cache["etag"],
+        "Cache-Control": PROPS_JSON_CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+    }
+    if _etag_matches(request, cache["etag"]):
+        return Response(status_code=304, headers=headers)
+    if _accepts_gzip(request):
+        headers["Content-Encoding"] = "gzip"
+        return Response(cache["gzip"], media_type="application/json", headers=headers)
+    return Response(cache["body"], media_type="application/json", headers=headers)
+
+
+# Rows per streamed chunk: one send per batch rather than per prop.
+PROPS_JSONL_BATCH = 500
+
+
+async def _iter_props_jsonl(props: List[Dict[str, Any]]):
+    # Async so StreamingResponse iterates it on the event loop; a sync
+    # generator would cost a threadpool hop per chunk.
+    for i in range(0, len(props), PROPS_JSONL_BATCH):
+        yield b"".join([json_dumps(p, newline=True) for p in props[i:i + PROPS_JSONL_BATCH]])
+
+
+@app.get("/props.jsonl")
+def props_jsonl():
+    """
+    Live board as JSON Lines (one prop per line), streamed in batches
+    so large boards don't need one big buffered body.
     """
     props = get_current_props()
-    return JSONResponse(props)
+    return StreamingResponse(_iter_props_jsonl(props), media_type="application/jsonl")
 
 # -------------------------------------------------------------------
 # Model-board filtering helpers
 # -------------------------------------------------------------------
 
 
+def _board_sort_key(p: Dict[str, Any]) -> Tuple[str, str, str]:
+    """
+    Board/export ordering: sport, then game_time, then player.
+    """
+    get = p.get
+    return (get("sport") or "", get("game_time") or "", get("player") or "")
+
+
 def _filter_props_for_board(
     sport: str,
     tiers_str: Optional[str],
@@ -994,16 +1584,14 @@ def _filter_props_for_board(
             if str(p.get("tier", "")).lower() in tier_set
         ]
 
-    filtered.sort(
-        key=lambda p: (
-            (p.get("sport") or ""),
-            (p.get("game_time") or ""),
-            (p.get("player") or ""),
-        )
-    )
+    filtered.sort(key=_board_sort_key)
     return filtered
 
 
+# Column header shared by the model-board pages and /export-data.
+BOARD_CSV_HEADER = "sport,player,team,opponent,stat,line,tier,game_time"
+
+
 def _build_model_page_text(
     sport_key: str,
     tiers_str: Optional[str],
@@ -1019,7 +1607,7 @@ def _build_model_page_text(
     filtered = _filter_props_for_board(sport_key, tiers_str)
     total = len(filtered)
     if total == 0:
-        return "sport,player,team,opponent,stat,line,tier,game_time\n"
+        return BOARD_CSV_HEADER + "\n"
 
     total_pages = (total + page_size - 1) // page_size
     if page > total_pages:
@@ -1032,24 +1620,15 @@ def _build_model_page_text(
     end = start + page_size
     page_props = filtered[start:end]
 
-    lines: List[str] = []
-    header = "sport,player,team,opponent,stat,line,tier,game_time"
-    lines.append(header)
-
-    for p in page_props:
-        line = ",".join(
-            [
-                _model_csv_val(p.get("sport", "")),
-                _model_csv_val(p.get("player", "")),
-                _model_csv_val(p.get("team", "")),
-                _model_csv_val(p.get("opponent", "")),
-                _model_csv_val(p.get("stat", "")),
-                str(p.get("line", "")),
-                _model_csv_val(p.get("tier", "")),
-                _model_csv_val(p.get("game_time", "")),
-            ]
-        )
-        lines.append(line)
+    # One f-string per row: no per-row list of fields to build and join.
+    v = _model_csv_val
+    lines: List[str] = [BOARD_CSV_HEADER]
+    lines += [
+        f'{v(p.get("sport", ""))},{v(p.get("player", ""))},{v(p.get("team", ""))},'
+        f'{v(p.get("opponent", ""))},{v(p.get("stat", ""))},{p.get("line", "")},'
+        f'{v(p.get("tier", ""))},{v(p.get("game_time", ""))}'
+        for p in page_props
+    ]
 
     return "\n".join(lines)
 
@@ -1058,14 +1637,36 @@ def _build_model_page_text(
 # -------------------------------------------------------------------
 
 
+# Short shared-cache window: scripts poll these, and a fresh upload shows
+# up within 30s at worst.
+MODEL_BOARD_CACHE_CONTROL = "public, max-age=30"
+
+
+@lru_cache(maxsize=32)
+def _cached_model_page_text(
+    board_etag: str,
+    sport_key: str,
+    tiers_str: Optional[str],
+    page: int,
+    page_size: int,
+) -> str:
+    """
+    _build_model_page_text() memoized per board version. board_etag is the
+    /props.json ETag, which changes whenever the live board does (upload,
+    out-of-band file edit, or a prop expiring), so entries for an old board
+    are never hit again and just age out. HTTPExceptions are not cached.
+    """
+    return _build_model_page_text(sport_key, tiers_str, page=page, page_size=page_size)
+
+
 @app.get("/model-board", response_class=PlainTextResponse)
 def model_board():
     """
     Full board as CSV in one page (debugging/scripts).
     For the model, use /model-index-main -> /model-index -> /model-board-view.
     """
-    text = _build_model_page_text("all", None, page=1, page_size=100000)
-    return PlainTextResponse(text)
+    text = _cached_model_page_text(get_props_body_cache()["etag"], "all", None, 1, 100000)
+    return PlainTextResponse(text, headers={"Cache-Control": MODEL_BOARD_CACHE_CONTROL})
 
 
 @app.get("/model-board/{sport}/page/{page}", response_class=PlainTextResponse)
@@ -1078,13 +1679,14 @@ def model_board_paged(
     """
     Paged CSV board for a single sport (slug).
     """
-    text = _build_model_page_text(
-        sport_key=sport,
-        tiers_str=tiers or None,
-        page=page,
-        page_size=page_size,
+    text = _cached_model_page_text(
+        get_props_body_cache()["etag"],
+        sport,
+        tiers or None,
+        page,
+        page_size,
     )
-    return PlainTextResponse(text)
+    return PlainTextResponse(text, headers={"Cache-Control": MODEL_BOARD_CACHE_CONTROL})
 
 # -------------------------------------------------------------------
 # Model-board HTML view (for ChatGPT)
@@ -1634,9 +2236,7 @@ def model_index(sport: str = "", tier: str = ""):
 # -------------------------------------------------------------------
 
 
-@app.get("/upload", response_class=HTMLResponse)
-def upload_page():
-    return """
+_UPLOAD_HTML = """
     <html>
       <head>
         <title>Upload PrizePicks / Underdog JSON</title>
@@ -1836,14 +2436,49 @@ def upload_page():
     </html>
     """
 
+_UPLOAD_PAGE = build_static_page(_UPLOAD_HTML)
+
+
+@app.get("/upload", response_class=HTMLResponse)
+async def upload_page(request: Request):
+    return static_page_response(request, _UPLOAD_PAGE)
+
 # -------------------------------------------------------------------
 # Upload API
 # -------------------------------------------------------------------
 
 
+async def read_body_capped(request: Request) -> bytes:
+    """
+    Read the request body, rejecting with 413 once it exceeds MAX_UPLOAD_BYTES.
+    A declared Content-Length is checked before anything is buffered; bodies
+    without one (chunked) are capped while streaming.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="Upload too large.")
+
+    chunks: List[bytes] = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail="Upload too large.")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
 @app.post("/update-props")
 async def update_props(request: Request):
-    payload = await request.json()
+    global _props_body_cache
+    body = await read_body_capped(request)
+    try:
+        payload = json_loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Request body is not valid JSON.")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON object.")
+
     sport_key = (payload.get("sport") or "").lower()
     sport_label = (payload.get("sport_label") or "").strip() or None
     raw = payload.get("raw")
@@ -1851,7 +2486,9 @@ async def update_props(request: Request):
     if not sport_key:
         raise HTTPException(status_code=400, detail="Missing 'sport' field.")
 
-    if sport_key != "extras" and sport_key not in SPORTS:
+    # One lookup validates the key and keeps its config for later.
+    sport_cfg = SPORTS.get(sport_key)
+    if sport_cfg is None and sport_key != "extras":
         raise HTTPException(status_code=400, detail="Invalid 'sport' field.")
 
     if not isinstance(raw, dict):
@@ -1878,15 +2515,10 @@ async def update_props(request: Request):
         )
 
     try:
-        if src_type == "prizepicks":
-            new_props = normalize_prizepicks(raw, sport_key, sport_label=sport_label)
-        else:
-            new_props = normalize_underdog(raw, sport_key, sport_label=sport_label)
+        new_props = normalize_upload_cached(body, src_type, raw, sport_key, sport_label=sport_label)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    existing = load_file_props_raw_or_empty()
-
     sport_slug: Optional[str] = None
     out_label: Optional[str] = None
     if new_props:
@@ -1897,46 +2529,43 @@ async def update_props(request: Request):
             out_label = sport_label or "Extras"
             sport_slug = sport_slug_from_label(out_label)
         else:
-            cfg = SPORTS[sport_key]
-            out_label = cfg["name"]
+            out_label = sport_cfg["name"]
             sport_slug = sport_key
 
-    # Remove any old props for this sport_slug, then append new ones
-    if sport_slug:
-        remaining = [p for p in existing if get_prop_sport_slug(p) != sport_slug]
-    else:
-        label_lower = (out_label or "").lower()
-        remaining = [p for p in existing if (p.get("sport") or "").lower() != label_lower]
-
-    combined = remaining + new_props
-    save_props(combined)
-
-    total_live = len(get_current_props())
-    return {
-        "status": "ok",
-        "sport": out_label,
-        "sport_key": sport_slug,
-        "source": src_type,
-        "count": len(new_props),
-        "total": total_live,
-    }
+    # Disk read/modify/write runs in a worker thread so the event loop keeps
+    # serving. replace_sport_props holds _props_file_lock against pruning
+    # GETs; the asyncio lock queues uploads here and keeps the body cache
+    # updates in write order.
+    # The bytes just written double as the /props.json body (one encode),
+    # and the cache entry is built on the worker too; only the swap is here.
+    async with _props_write_lock:
+        live, cache_entry = await asyncio.to_thread(replace_sport_props, new_props, sport_slug, out_label)
+        _props_body_cache = cache_entry
+    total_live = len(live)
+    return FastJSONResponse(
+        {
+            "status": "ok",
+            "sport": out_label,
+            "sport_key": sport_slug,
+            "source": src_type,
+            "count": len(new_props),
+            "total": total_live,
+        }
+    )
 
 # -------------------------------------------------------------------
 # Export page (multi-sport, pretty CSV)
 # -------------------------------------------------------------------
 
 
-@app.get("/export", response_class=HTMLResponse)
-def export_page():
-    sport_labels: List[str] = []
-    for key, cfg in SPORTS.items():
-        name = cfg["name"]
-        sport_labels.append(
-            f'<label><input type="checkbox" class="sport-checkbox" value="{key}" checked /> {name} ({key})</label>'
-        )
-    sports_html = "\n".join(sport_labels)
+# SPORTS is fixed at import time, so the whole page (checkboxes included)
+# is built once, like the board and upload pages.
+_EXPORT_SPORTS_HTML = "\n".join(
+    f'<label><input type="checkbox" class="sport-checkbox" value="{key}" checked /> {cfg["name"]} ({key})</label>'
+    for key, cfg in SPORTS.items()
+)
 
-    return """
+_EXPORT_HTML = """
     <html>
       <head>
         <title>Export Props for ChatGPT</title>
@@ -2048,7 +2677,7 @@ def export_page():
           <div class="row">
             <label>Sports</label>
             <div class="pill-group" id="sports-group">
-    """ + sports_html + """
+    """ + _EXPORT_SPORTS_HTML + """
             </div>
           </div>
 
@@ -2125,10 +2754,22 @@ def export_page():
     </html>
     """
 
+_EXPORT_PAGE = build_static_page(_EXPORT_HTML)
+
+
+@app.get("/export", response_class=HTMLResponse)
+async def export_page(request: Request):
+    return static_page_response(request, _EXPORT_PAGE)
+
 
 @app.post("/export-data")
 async def export_data(request: Request):
-    payload = await request.json()
+    try:
+        payload = json_loads(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Request body is not valid JSON.")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON object.")
     sports = payload.get("sports")
     tiers = payload.get("tiers") or []
     max_props = payload.get("max") or 300
@@ -2167,20 +2808,12 @@ async def export_data(request: Request):
             continue
         filtered.append(p)
 
-    filtered.sort(
-        key=lambda p: (
-            (p.get("sport") or ""),
-            (p.get("game_time") or ""),
-            (p.get("player") or ""),
-        )
-    )
+    filtered.sort(key=_board_sort_key)
 
     if len(filtered) > max_props:
         filtered = filtered[:max_props]
 
-    lines: List[str] = []
-    header = "sport,player,team,opponent,stat,line,tier,game_time"
-    lines.append(header)
+    lines: List[str] = [BOARD_CSV_HEADER]
 
     for p in filtered:
         line = ",".join(
@@ -2198,7 +2831,7 @@ async def export_data(request: Request):
         lines.append(line)
 
     text = "\n".join(lines)
-    return {"text": text, "count": len(filtered)}
+    return FastJSONResponse({"text": text, "count": len(filtered)})
 
 # -------------------------------------------------------------------
 # JSON model-board (for your own tools; model can't see JSON)
@@ -2252,13 +2885,7 @@ def model_board_json(
             continue
         filtered.append(p)
 
-    filtered.sort(
-        key=lambda p: (
-            (p.get("sport") or ""),
-            (p.get("game_time") or ""),
-            (p.get("player") or ""),
-        )
-    )
+    filtered.sort(key=_board_sort_key)
 
     result: List[Dict[str, Any]] = []
     for p in filtered:
@@ -2278,4 +2905,26 @@ def model_board_json(
             }
         )
 
-    return JSONResponse(result)
+    return FastJSONResponse(result)
+
+# -------------------------------------------------------------------
+# Entry point (python main.py)
+# -------------------------------------------------------------------
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # "auto" picks uvloop + httptools when installed (uvicorn[standard] on
+    # Linux/macOS) and falls back to asyncio + h11 elsewhere. Access logging
+    # is off: it is a synchronous stderr write per request. Set
+    # WEB_CONCURRENCY > 1 for more worker processes; the upload lock is per
+    # process, though.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.environ.get("PORT", "8000")),
+        loop="auto",
+        http="auto",
+        workers=int(os.environ.get("WEB_CONCURRENCY", "1")),
+        access_log=False,
+    )